@@ -33,6 +33,9 @@ class Config:
     SECRET_KEY = os.getenv('SECRET_KEY', 'your-secret-key-change-in-production')
     DEBUG = os.getenv('DEBUG', 'False').lower() == 'true'
 
+    # Seconds a theatre listing is served from the in-process cache (0 disables)
+    THEATRE_LIST_CACHE_TTL = float(os.getenv('THEATRE_LIST_CACHE_TTL', '5'))
+
     # External services
     MOVIE_SERVICE_URL = os.getenv('MOVIE_SERVICE_URL', 'http://localhost:8050')
     BOOKING_SERVICE_URL = os.getenv('BOOKING_SERVICE_URL', 'http://localhost:5002')
@@ -7,7 +7,7 @@ FastAPI application for managing theatres, screens, cinemas, and showtimes.
 import os
 
 from fastapi import FastAPI
-from fastapi.responses import Response
+from fastapi.responses import ORJSONResponse, Response
 
 from routers import theatre_routes, screen_routes, cinema_routes, showtime_routes, health_routes
 
@@ -20,6 +20,7 @@ app = FastAPI(
     title="Nebula Booking Theatre Service API",
     description="FastAPI app using Pydantic v2 models for Theatre, Screen, and Cinema management",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
 )
 
 # Register routers
@@ -15,14 +15,13 @@ from sqlalchemy.orm import Session
 
 
 router = APIRouter(prefix="/cinemas", tags=["cinemas"])
+service = CinemaDataService()
 
 
 @router.post("", response_model=CinemaRead, status_code=201)
 def create_cinema(cinema: CinemaCreate, response: Response, db: Session = Depends(get_db)):
     """Create a new cinema in the database."""
-    db_service = CinemaDataService()
-    
-    cinema_obj = db_service.create_cinema(
+    cinema_obj = service.create_cinema(
         db=db,
         name=cinema.name,
         created_by=1  # Placeholder - would come from auth
@@ -38,8 +37,7 @@ def list_cinemas(
     db: Session = Depends(get_db),
 ):
     """List cinemas from the database. Supports filtering by name."""
-    db_service = CinemaDataService()
-    db_cinemas = db_service.get_all_cinemas(db)
+    db_cinemas = service.get_all_cinemas(db)
     
     items: List[CinemaRead] = [
         CinemaRead(**dict_to_cinema_read(db_item))
@@ -60,8 +58,7 @@ def get_cinema(
     db: Session = Depends(get_db)
 ):
     """Get a specific cinema from the database by ID."""
-    db_service = CinemaDataService()
-    db_item = db_service.get_cinema_by_id(db, cinema_id)
+    db_item = service.get_cinema_by_id(db, cinema_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Cinema not found")
     
@@ -84,8 +81,7 @@ def update_cinema(
     db: Session = Depends(get_db)
 ):
     """Update a cinema (partial update) in the database."""
-    db_service = CinemaDataService()
-    db_item = db_service.get_cinema_by_id(db, cinema_id)
+    db_item = service.get_cinema_by_id(db, cinema_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Cinema not found")
     
@@ -98,7 +94,7 @@ def update_cinema(
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
     updates = update.model_dump(exclude_none=True)
-    success = db_service.update_cinema(
+    success = service.update_cinema(
         db=db,
         cinema_id=cinema_id,
         name=updates.get('name')
@@ -107,7 +103,7 @@ def update_cinema(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to update cinema")
     
-    db_item = db_service.get_cinema_by_id(db, cinema_id)
+    db_item = service.get_cinema_by_id(db, cinema_id)
     updated = CinemaRead(**dict_to_cinema_read(db_item))
     
     new_etag = calc_etag(updated)
@@ -124,8 +120,7 @@ def replace_cinema(
     db: Session = Depends(get_db)
 ):
     """Replace entire cinema resource (PUT) in the database."""
-    db_service = CinemaDataService()
-    db_item = db_service.get_cinema_by_id(db, cinema_id)
+    db_item = service.get_cinema_by_id(db, cinema_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Cinema not found")
     
@@ -137,7 +132,7 @@ def replace_cinema(
     if if_match != current_etag:
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
-    success = db_service.update_cinema(
+    success = service.update_cinema(
         db=db,
         cinema_id=cinema_id,
         name=cinema.name
@@ -146,7 +141,7 @@ def replace_cinema(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to replace cinema")
     
-    db_item = db_service.get_cinema_by_id(db, cinema_id)
+    db_item = service.get_cinema_by_id(db, cinema_id)
     replacement = CinemaRead(**dict_to_cinema_read(db_item))
     
     new_etag = calc_etag(replacement)
@@ -161,8 +156,7 @@ def delete_cinema(
     db: Session = Depends(get_db)
 ):
     """Soft delete a cinema from the database."""
-    db_service = CinemaDataService()
-    db_item = db_service.get_cinema_by_id(db, cinema_id)
+    db_item = service.get_cinema_by_id(db, cinema_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Cinema not found")
     
@@ -172,7 +166,7 @@ def delete_cinema(
     if if_match is not None and if_match != current_etag:
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
-    success = db_service.delete_cinema(db, cinema_id)
+    success = service.delete_cinema(db, cinema_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete cinema")
     
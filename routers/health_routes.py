@@ -1,11 +1,10 @@
 """Health check API endpoints."""
 
 import socket
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Path, Query
-from fastapi.responses import Response
 
 from schemas.health import Health
 
@@ -13,6 +12,17 @@ from schemas.health import Health
 router = APIRouter(prefix="/health", tags=["health"])
 
 
+def _resolve_local_ip() -> str:
+    """Resolve this host's IP address once; it does not change while running."""
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "127.0.0.1"
+
+
+_LOCAL_IP = _resolve_local_ip()
+
+
 def make_health(echo: Optional[str], path_echo: Optional[str] = None) -> Health:
     """
     Create a Health response object.
@@ -27,8 +37,8 @@ def make_health(echo: Optional[str], path_echo: Optional[str] = None) -> Health:
     return Health(
         status=200,
         status_message="OK",
-        timestamp=datetime.utcnow().isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname()),
+        timestamp=datetime.now(timezone.utc),
+        ip_address=_LOCAL_IP,
         echo=echo,
         path_echo=path_echo
     )
@@ -47,9 +57,3 @@ def get_health_with_path(
 ):
     """Health check endpoint with path parameter."""
     return make_health(echo=echo, path_echo=path_echo)
-
-
-@router.get("/favicon.ico", include_in_schema=False)
-def favicon():
-    """Favicon endpoint to avoid noisy 404s from browsers."""
-    return Response(status_code=204)
@@ -16,14 +16,13 @@ from sqlalchemy.orm import Session
 
 
 router = APIRouter(prefix="/screens", tags=["screens"])
+service = ScreenDataService()
 
 
 @router.post("", response_model=ScreenRead, status_code=201)
 def create_screen(screen: ScreenCreate, response: Response, db: Session = Depends(get_db)):
     """Create a new screen in the database."""
-    db_service = ScreenDataService()
-    
-    screen_obj = db_service.create_screen(
+    screen_obj = service.create_screen(
         db=db,
         theatre_id=1,  # Placeholder - would map UUID to int
         screen_number=screen.screen_number,
@@ -32,7 +31,7 @@ def create_screen(screen: ScreenCreate, response: Response, db: Session = Depend
         created_by=1  # Placeholder - would come from auth
     )
     
-    # db_item = db_service.get_screen_by_id(screen_id)
+    # db_item = service.get_screen_by_id(screen_id)
     # if not db_item:
     #     raise HTTPException(status_code=500, detail="Failed to create screen")
     
@@ -48,8 +47,7 @@ def list_screens(
     db: Session = Depends(get_db),
 ):
     """List all screens from the database with optional filtering."""
-    db_service = ScreenDataService()
-    db_screens = db_service.get_all_screens(db)
+    db_screens = service.get_all_screens(db)
     
     items: List[ScreenRead] = [
         ScreenRead(**dict_to_screen_read(db_item))
@@ -72,8 +70,7 @@ def get_screen(
     db: Session = Depends(get_db)
 ):
     """Get a specific screen from the database by ID."""
-    db_service = ScreenDataService()
-    db_item = db_service.get_screen_by_id(db, screen_id)
+    db_item = service.get_screen_by_id(db, screen_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Screen not found")
     
@@ -96,8 +93,7 @@ def update_screen(
     db: Session = Depends(get_db)
 ):
     """Update a screen (partial update) in the database."""
-    db_service = ScreenDataService()
-    db_item = db_service.get_screen_by_id(db, screen_id)
+    db_item = service.get_screen_by_id(db, screen_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Screen not found")
     
@@ -110,7 +106,7 @@ def update_screen(
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
     updates = update.model_dump(exclude_none=True)
-    success = db_service.update_screen(
+    success = service.update_screen(
         db=db,
         screen_id=screen_id,
         screen_number=updates.get('screen_number'),
@@ -121,7 +117,7 @@ def update_screen(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to update screen")
     
-    db_item = db_service.get_screen_by_id(db, screen_id)
+    db_item = service.get_screen_by_id(db, screen_id)
     updated = ScreenRead(**dict_to_screen_read(db_item))
     
     new_etag = calc_etag(updated)
@@ -138,8 +134,7 @@ def replace_screen(
     db: Session = Depends(get_db)
 ):
     """Replace entire screen resource (PUT) in the database."""
-    db_service = ScreenDataService()
-    db_item = db_service.get_screen_by_id(db, screen_id)
+    db_item = service.get_screen_by_id(db, screen_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Screen not found")
     
@@ -151,7 +146,7 @@ def replace_screen(
     if if_match != current_etag:
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
-    success = db_service.update_screen(
+    success = service.update_screen(
         db=db,
         screen_id=screen_id,
         screen_number=screen.screen_number,
@@ -162,7 +157,7 @@ def replace_screen(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to replace screen")
     
-    db_item = db_service.get_screen_by_id(db, screen_id)
+    db_item = service.get_screen_by_id(db, screen_id)
     replacement = ScreenRead(**dict_to_screen_read(db_item))
     
     new_etag = calc_etag(replacement)
@@ -177,8 +172,7 @@ def delete_screen(
     db: Session = Depends(get_db)
 ):
     """Soft delete a screen from the database."""
-    db_service = ScreenDataService()
-    db_item = db_service.get_screen_by_id(db, screen_id)
+    db_item = service.get_screen_by_id(db, screen_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Screen not found")
     
@@ -188,7 +182,7 @@ def delete_screen(
     if if_match is not None and if_match != current_etag:
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
-    success = db_service.delete_screen(db, screen_id)
+    success = service.delete_screen(db, screen_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete screen")
     
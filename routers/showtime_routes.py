@@ -25,14 +25,13 @@ from utils.converters import dict_to_showtime_read
 
 
 router = APIRouter(prefix="/showtimes", tags=["showtimes"])
+service = ShowtimeDataService()
+screen_service = ScreenDataService()
 
 
 @router.post("", response_model=ShowtimeRead, status_code=201)
 def create_showtime(showtime: ShowtimeCreate, response: Response, db: Session = Depends(get_db)):
     """Create a new showtime in the database."""
-    db_service = ShowtimeDataService()
-    screen_service = ScreenDataService()
-    
     # Verify screen exists
     screen_id_int = showtime.screen_id
     screen = screen_service.get_screen_by_id(db, screen_id_int)
@@ -64,7 +63,7 @@ def create_showtime(showtime: ShowtimeCreate, response: Response, db: Session =
         raise HTTPException(status_code=502, detail=payload)
 
     # All checks passed; create showtime
-    db_item = db_service.create_showtime(
+    db_item = service.create_showtime(
         db=db,
         screen_id=screen_id_int,
         movie_id=showtime.movie_id,
@@ -74,7 +73,7 @@ def create_showtime(showtime: ShowtimeCreate, response: Response, db: Session =
         created_by=1,  # Placeholder - would come from auth
     )
     
-    # db_item = db_service.get_showtime_by_id(showtime_id)
+    # db_item = service.get_showtime_by_id(showtime_id)
     # if not db_item:
     #     raise HTTPException(status_code=500, detail="Failed to create showtime")
     
@@ -91,15 +90,13 @@ def list_showtimes(
     db: Session = Depends(get_db),
 ):
     """List all showtimes from the database with optional filtering."""
-    db_service = ShowtimeDataService()
-    
     # Get all showtimes or filter by specific criteria
     if screen_id:
-        db_showtimes = db_service.get_showtimes_by_screen(db, screen_id)
+        db_showtimes = service.get_showtimes_by_screen(db, screen_id)
     elif movie_id is not None:
-        db_showtimes = db_service.get_showtimes_by_movie(db, movie_id)
+        db_showtimes = service.get_showtimes_by_movie(db, movie_id)
     else:
-        db_showtimes = db_service.get_all_showtimes(db)
+        db_showtimes = service.get_all_showtimes(db)
     
     items: List[ShowtimeRead] = [
         ShowtimeRead(**dict_to_showtime_read(db_item))
@@ -120,10 +117,7 @@ def get_showtime(
     db: Session = Depends(get_db)
 ):
     """Get a specific showtime from the database by ID."""
-    db_service = ShowtimeDataService()
-    showtime_id_int = int(str(showtime_id).replace('-', '')[:8], 16) % (10**9)
-    
-    db_item = db_service.get_showtime_by_id(db, showtime_id)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Showtime not found")
     
@@ -146,10 +140,7 @@ def update_showtime(
     db: Session = Depends(get_db)
 ):
     """Update a showtime (partial update) in the database."""
-    db_service = ShowtimeDataService()
-    showtime_id_int = int(str(showtime_id).replace('-', '')[:8], 16) % (10**9)
-    
-    db_item = db_service.get_showtime_by_id(db, showtime_id)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Showtime not found")
     
@@ -162,7 +153,7 @@ def update_showtime(
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
     updates = update.model_dump(exclude_none=True)
-    success = db_service.update_showtime(
+    success = service.update_showtime(
         db=db,
         showtime_id=showtime_id,
         movie_id=updates.get('movie_id'),
@@ -174,7 +165,7 @@ def update_showtime(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to update showtime")
     
-    db_item = db_service.get_showtime_by_id(showtime_id_int)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     updated = ShowtimeRead(**dict_to_showtime_read(db_item))
     
     new_etag = calc_etag(updated)
@@ -191,10 +182,7 @@ def replace_showtime(
     db: Session = Depends(get_db)
 ):
     """Replace entire showtime resource (PUT) in the database."""
-    db_service = ShowtimeDataService()
-    showtime_id_int = int(str(showtime_id).replace('-', '')[:8], 16) % (10**9)
-    
-    db_item = db_service.get_showtime_by_id(db, showtime_id)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Showtime not found")
     
@@ -206,7 +194,7 @@ def replace_showtime(
     if if_match != current_etag:
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
-    success = db_service.update_showtime(
+    success = service.update_showtime(
         db=db,
         showtime_id=showtime_id,
         movie_id=showtime.movie_id,
@@ -218,7 +206,7 @@ def replace_showtime(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to replace showtime")
     
-    db_item = db_service.get_showtime_by_id(showtime_id_int)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     replacement = ShowtimeRead(**dict_to_showtime_read(db_item))
     
     new_etag = calc_etag(replacement)
@@ -233,10 +221,7 @@ def delete_showtime(
     db: Session = Depends(get_db)
 ):
     """Soft delete a showtime from the database."""
-    db_service = ShowtimeDataService()
-    showtime_id_int = int(str(showtime_id).replace('-', '')[:8], 16) % (10**9)
-    
-    db_item = db_service.get_showtime_by_id(db, showtime_id)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Showtime not found")
     
@@ -246,7 +231,7 @@ def delete_showtime(
     if if_match is not None and if_match != current_etag:
         raise HTTPException(status_code=412, detail="Precondition Failed: ETag mismatch")
     
-    success = db_service.delete_showtime(db, showtime_id)
+    success = service.delete_showtime(db, showtime_id)
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete showtime")
     
@@ -256,11 +241,7 @@ def delete_showtime(
 @router.get("/{showtime_id}/availability", response_model=SeatAvailabilityResponse)
 def get_seat_availability(showtime_id: int, db: Session = Depends(get_db)):
     """Get seat availability information for a showtime from the database."""
-    db_service = ShowtimeDataService()
-    screen_service = ScreenDataService()
-    showtime_id_int = int(str(showtime_id).replace('-', '')[:8], 16) % (10**9)
-    
-    db_item = db_service.get_showtime_by_id(db, showtime_id)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Showtime not found")
     
@@ -296,11 +277,7 @@ def update_seat_count(
     Positive count = book seats, Negative count = release seats.
     Called by Booking Service when seats are booked or released.
     """
-    db_service = ShowtimeDataService()
-    screen_service = ScreenDataService()
-    showtime_id_int = int(str(showtime_id).replace('-', '')[:8], 16) % (10**9)
-    
-    db_item = db_service.get_showtime_by_id(db, showtime_id)
+    db_item = service.get_showtime_by_id(db, showtime_id)
     if not db_item:
         raise HTTPException(status_code=404, detail="Showtime not found")
     
@@ -328,7 +305,7 @@ def update_seat_count(
         )
     
     # Update seat count in database
-    updated_item = db_service.update_seat_count(db, showtime_id, seat_update.count)
+    updated_item = service.update_seat_count(db, showtime_id, seat_update.count)
     if not updated_item:
         raise HTTPException(status_code=500, detail="Failed to update seat count")
     
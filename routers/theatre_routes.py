@@ -1,22 +1,45 @@
 """Theatre API endpoints - using SQLAlchemy ORM."""
 
+import threading
+import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from fastapi import APIRouter, HTTPException, Header, Query, Depends
 from fastapi.responses import Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+import orjson
 
+from config import Config
 from schemas.theatre import TheatreCreate, TheatreRead, TheatreUpdate
 from services.theatreDataService import TheatreDataService
-from database import get_db
-from utils.etag import calc_etag
+from database import get_async_db, get_db
+from utils.etag import calc_etag, calc_payload_etag
 from utils.converters import dict_to_theatre_read
 
 
 router = APIRouter(prefix="/theatres", tags=["theatres"])
 service = TheatreDataService()
 
+# Serialized listings keyed by (lowercased name, cinema_id), each stored as
+# (cached_at, body, etag). Other processes' writes show up once the TTL expires;
+# local writes bump theatre_list_version so in-flight reads don't re-cache old data.
+# Writes run on threadpool workers while listings run on the event loop, so both
+# sides update the cache and version under theatre_list_lock.
+THEATRE_LIST_CACHE_SIZE = 128
+theatre_list_cache: Dict[Tuple[Optional[str], Optional[int]], Tuple[float, bytes, str]] = {}
+theatre_list_version = 0
+theatre_list_lock = threading.Lock()
+
+
+def _invalidate_theatre_list() -> None:
+    """Drop cached listings after a theatre is written."""
+    global theatre_list_version
+    with theatre_list_lock:
+        theatre_list_version += 1
+        theatre_list_cache.clear()
+
 
 @router.post("", response_model=TheatreRead, status_code=201)
 def create_theatre(
@@ -36,30 +59,53 @@ def create_theatre(
     
     theatre_read = TheatreRead(**dict_to_theatre_read(new_theatre))
     response.headers["ETag"] = calc_etag(theatre_read)
+    _invalidate_theatre_list()
     return theatre_read
 
 
 @router.get("", response_model=List[TheatreRead])
-def list_theatres(
+async def list_theatres(
     name: Optional[str] = Query(None, description="Filter by theatre name"),
     cinema_id: Optional[int] = Query(None, description="Filter by cinema_id"),
-    db: Session = Depends(get_db)
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List theatres from the database. Supports filtering by name and cinema_id."""
-    theatres = service.get_all_theatres(db)
-    
-    items: List[TheatreRead] = [
-        TheatreRead(**dict_to_theatre_read(t))
-        for t in theatres
-    ]
+    needle = name.lower() if name else None
+    key = (needle, cinema_id or None)
+    cached = theatre_list_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < Config.THEATRE_LIST_CACHE_TTL:
+        _, body, etag = cached
+    else:
+        version = theatre_list_version
+        if cinema_id:
+            theatres = await service.get_theatres_by_cinema_async(db, cinema_id)
+        else:
+            theatres = await service.get_all_theatres_async(db)
+        
+        # Apply filters on the rows so only matches are turned into models
+        if needle:
+            theatres = [t for t in theatres if needle in t.name.lower()]
+        
+        # Rows come straight from our own database, so skip field validation.
+        # Returning a response directly skips FastAPI re-validating every item
+        # against response_model, which is kept for the OpenAPI schema.
+        body = orjson.dumps([
+            TheatreRead.model_construct(**dict_to_theatre_read(t)).model_dump()
+            for t in theatres
+        ])
+        etag = calc_payload_etag(body)
+        
+        with theatre_list_lock:
+            if version == theatre_list_version:
+                if len(theatre_list_cache) >= THEATRE_LIST_CACHE_SIZE:
+                    theatre_list_cache.pop(next(iter(theatre_list_cache)))
+                theatre_list_cache[key] = (time.monotonic(), body, etag)
     
-    # Apply filters
-    if name:
-        items = [t for t in items if name.lower() in t.name.lower()]
-    if cinema_id:
-        items = [t for t in items if t.cinema_id == cinema_id]
+    if if_none_match == etag:
+        return Response(status_code=304, headers={"ETag": etag})
     
-    return items
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/{theatre_id}", response_model=TheatreRead)
@@ -119,6 +165,7 @@ def update_theatre(
     
     result = TheatreRead(**dict_to_theatre_read(updated_theatre))
     new_etag = calc_etag(result)
+    _invalidate_theatre_list()
     response.headers["ETag"] = new_etag
     return result
 
@@ -157,6 +204,7 @@ def replace_theatre(
     
     result = TheatreRead(**dict_to_theatre_read(updated_theatre))
     new_etag = calc_etag(result)
+    _invalidate_theatre_list()
     response.headers["ETag"] = new_etag
     return result
 
@@ -182,4 +230,5 @@ def delete_theatre(
     if not success:
         raise HTTPException(status_code=500, detail="Failed to delete theatre")
     
+    _invalidate_theatre_list()
     return {"status": "deleted", "id": theatre_id}
@@ -1,12 +1,25 @@
 """Data service layer for Theatre operations using SQLAlchemy ORM."""
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import and_, select
 
 from models.models import Theatre
 from database import get_db
 
+# Columns read when rendering a theatre listing; the soft-delete and audit
+# columns are left unloaded to keep the rows small.
+_LIST_COLUMNS = load_only(
+    Theatre.theatre_id,
+    Theatre.cinema_id,
+    Theatre.name,
+    Theatre.address,
+    Theatre.screen_count,
+    Theatre.created_at,
+    Theatre.updated_at,
+)
+
 
 class TheatreDataService:
     """Service layer for Theatre data operations"""
@@ -15,6 +28,13 @@ class TheatreDataService:
         """Retrieve all non-deleted theatres from database."""
         return db.query(Theatre).filter(Theatre.is_deleted == False).all()
 
+    async def get_all_theatres_async(self, db: AsyncSession) -> List[Theatre]:
+        """Retrieve all non-deleted theatres without blocking the event loop."""
+        result = await db.execute(
+            select(Theatre).options(_LIST_COLUMNS).filter(Theatre.is_deleted == False)
+        )
+        return list(result.scalars().all())
+
     def get_theatre_by_id(self, db: Session, theatre_id: int) -> Optional[Theatre]:
         """Retrieve a specific theatre by ID."""
         return db.query(Theatre).filter(
@@ -33,6 +53,16 @@ class TheatreDataService:
             )
         ).all()
 
+    async def get_theatres_by_cinema_async(self, db: AsyncSession, cinema_id: int) -> List[Theatre]:
+        """Retrieve all theatres for a specific cinema without blocking the event loop."""
+        result = await db.execute(select(Theatre).options(_LIST_COLUMNS).filter(
+            and_(
+                Theatre.cinema_id == cinema_id,
+                Theatre.is_deleted == False
+            )
+        ))
+        return list(result.scalars().all())
+
     def create_theatre(
         self,
         db: Session,
@@ -1,34 +1,36 @@
 """Utility functions for ETag calculation."""
 
-import hashlib
-import json
-from datetime import datetime
-from json import JSONEncoder
-
-
-class PydanticJSONEncoder(JSONEncoder):
-    """Custom JSON encoder for Pydantic models with datetime support."""
-    def default(self, o):
-        if isinstance(o, datetime):
-            return o.isoformat() + "Z"
-        return super().default(o)
+from xxhash import xxh3_128_hexdigest
 
 
 def calc_etag(obj) -> str:
     """
-    Calculate a strong ETag: SHA-256 of the JSON payload (stable keys, no spaces).
+    Calculate a strong ETag: XXH3-128 of the compact JSON payload.
     Returns a quoted value like "c0ffee...".
 
+    ETags are opaque validators (RFC 7232), so a fast non-cryptographic
+    digest is sufficient. Keys are not sorted: Pydantic always emits fields
+    in class definition order, so an ETag is stable for as long as the
+    model schema is, and changes whenever fields are added or reordered.
+
     Args:
         obj: Pydantic model instance to calculate ETag for
 
     Returns:
-        str: Quoted SHA-256 hash of the serialized object
+        str: Quoted XXH3-128 hash of the serialized object
+    """
+    payload = obj.model_dump_json(exclude_none=True).encode("utf-8")
+    return f'"{xxh3_128_hexdigest(payload)}"'
+
+
+def calc_payload_etag(payload: bytes) -> str:
+    """
+    Calculate a strong ETag for an already serialized response body.
+
+    Args:
+        payload: Exact bytes sent to the client
+
+    Returns:
+        str: Quoted XXH3-128 hash of the payload
     """
-    payload = json.dumps(
-        obj.model_dump(exclude_none=True),
-        sort_keys=True,
-        separators=(",", ":"),
-        cls=PydanticJSONEncoder,
-    ).encode("utf-8")
-    return f'"{hashlib.sha256(payload).hexdigest()}"'
+    return f'"{xxh3_128_hexdigest(payload)}"'